@@ -13,6 +13,7 @@ from .database import UserSettingsManager, UserActivityLogger
 from .locales import Localization
 from .utils import KeyboardBuilder, DownloadManager
 from .utils.soundcloud_service import SoundcloudService
+from .utils.cobalt_service import cobalt
 from .handlers import CommandHandlers, MessageHandlers, CallbackHandlers, PaymentHandlers, InlineHandlers
 
 # Configure logging
@@ -188,6 +189,12 @@ class ZenloadBot:
             except Exception as e:
                 logger.warning(f"Error closing SoundCloud service: {e}")
 
+            # Close Cobalt session
+            try:
+                await asyncio.wait_for(cobalt.close(), timeout=3)
+            except Exception as e:
+                logger.warning(f"Error closing Cobalt service: {e}")
+
             # Release lock file and cleanup PID file
             if self.lock_fd is not None:
                 try:
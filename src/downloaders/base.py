@@ -2,6 +2,7 @@ import os
 import logging
 import re
 import asyncio
+import time
 from typing import Tuple, Dict, List, Callable, Any
 from pathlib import Path
 from abc import ABC, abstractmethod
@@ -24,6 +25,8 @@ class BaseDownloader(ABC):
         self.ydl_opts = YTDLP_OPTIONS.get(self.platform_id(), {}).copy()
         self._progress_callback = None
         self._loop = None
+        self._last_progress = -1
+        self._last_progress_ts = 0.0
 
     def set_progress_callback(self, callback: Callable[[str, int], None]):
         """Set callback for progress updates"""
@@ -46,6 +49,13 @@ class BaseDownloader(ABC):
                 downloaded = d.get('downloaded_bytes', 0)
                 if total > 0:
                     progress = int((downloaded / total) * 80) + 10  # Scale between 10-90%
+                    # Coalesce: yt-dlp fires this per chunk, but the UI only
+                    # needs a new value per 1% step or every half second
+                    now = time.monotonic()
+                    if progress == self._last_progress and now - self._last_progress_ts < 0.5:
+                        return
+                    self._last_progress = progress
+                    self._last_progress_ts = now
                     self.update_progress('status_downloading', progress)
             except Exception as e:
                 logger.error(f"Error in progress hook: {e}")
@@ -5,17 +5,24 @@ import logging
 import asyncio
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
+from urllib.parse import urlsplit
 import yt_dlp
 
 from .base import BaseDownloader, DownloadError
+from ..config import DOWNLOADS_DIR
 from ..utils.cobalt_service import cobalt
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; single alternation covers /p/, /reel(s)/ and /tv/ URLs
+_SHORTCODE_RE = re.compile(r'instagram\.com/(?:p|reels?|tv)/([A-Za-z0-9_-]+)')
+
+_IG_HOSTS = ('instagram.com', 'instagr.am')
+
 
 class InstagramDownloader(BaseDownloader):
     """Instagram downloader using Cobalt API with yt-dlp fallback"""
-    
+
     def __init__(self):
         super().__init__()
         self.ydl_opts.update({
@@ -24,62 +31,41 @@ class InstagramDownloader(BaseDownloader):
             'quiet': True,
             'no_warnings': True,
         })
+        # Resolved once; config already creates the directory at import
+        self._download_dir = DOWNLOADS_DIR
 
     def _extract_shortcode(self, url: str) -> Optional[str]:
         """Extract shortcode from Instagram URL"""
-        patterns = [
-            r'instagram\.com/p/([A-Za-z0-9_-]+)',
-            r'instagram\.com/reel/([A-Za-z0-9_-]+)',
-            r'instagram\.com/reels/([A-Za-z0-9_-]+)',
-            r'instagram\.com/tv/([A-Za-z0-9_-]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _SHORTCODE_RE.search(url)
+        return match.group(1) if match else None
 
     def platform_id(self) -> str:
         return 'instagram'
 
     def can_handle(self, url: str) -> bool:
-        return any(x in url for x in ["instagram.com", "instagr.am"])
+        try:
+            host = (urlsplit(url).hostname or '').lower()
+        except ValueError:
+            return False
+        # Exact or dot-boundary match so lookalikes (evilinstagram.com)
+        # cannot claim the URL
+        return any(host == d or host.endswith('.' + d) for d in _IG_HOSTS)
 
     async def get_formats(self, url: str) -> List[Dict]:
         """Get available formats"""
-        self.update_progress('status_getting_info', 0)
-        
-        # Try Cobalt first
-        result = await cobalt.request(url)
-        if result.success:
-            self.update_progress('status_getting_info', 100)
-            return [{'id': 'best', 'quality': 'Best', 'ext': 'mp4'}]
-        
-        # Fallback to yt-dlp
-        logger.info(f"[Instagram] Cobalt failed ({result.error}), trying yt-dlp")
-        try:
-            def extract():
-                with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                    return ydl.extract_info(url, download=False)
-            
-            info = await asyncio.to_thread(extract)
-            self.update_progress('status_getting_info', 100)
-            
-            return [{'id': 'best', 'quality': 'Best', 'ext': 'mp4'}]
-            
-        except Exception as e:
-            logger.error(f"[Instagram] Format error: {e}")
-            # Even if format extraction fails, we can try downloading
-            return [{'id': 'best', 'quality': 'Best', 'ext': 'mp4'}]
+        # Instagram always resolves to a single 'best' mp4 regardless of which
+        # backend (Cobalt or yt-dlp) ends up serving the download, so probing
+        # them serially here only delays the download itself.
+        self.update_progress('status_getting_info', 100)
+        return [{'id': 'best', 'quality': 'Best', 'ext': 'mp4'}]
 
     async def download(self, url: str, format_id: Optional[str] = None) -> Tuple[str, Path]:
         """Download video - Cobalt first, yt-dlp fallback"""
         shortcode = self._extract_shortcode(url) or 'video'
-        logger.info(f"[Instagram] Downloading: {shortcode}")
-        
-        download_dir = Path(__file__).parent.parent.parent / "downloads"
-        download_dir.mkdir(exist_ok=True)
+        logger.debug("[Instagram] Downloading: %s", shortcode)
         
+        download_dir = self._download_dir
+
         # === Try Cobalt ===
         self.update_progress('status_downloading', 10)
         filename, file_path = await cobalt.download(
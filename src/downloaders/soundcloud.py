@@ -68,7 +68,7 @@ class SoundcloudDownloader(BaseDownloader):
         if artist:
             parts.append(f"By: {artist}")
 
-        duration_ms = track_meta.get("duration") or track_meta.get("full_duration")
+        duration_ms = track_meta.get("duration")
         if duration_ms:
             minutes = int(duration_ms) // 60000
             seconds = int(duration_ms) % 60000 // 1000
@@ -10,14 +10,38 @@ from time import sleep
 from urllib.parse import urlparse
 import yt_dlp
 from .base import BaseDownloader, DownloadError
+from ..config import DOWNLOADS_DIR
 from ..utils.cobalt_service import cobalt
 
 logger = logging.getLogger(__name__)
 
 
+def _format_number(num) -> str:
+    """Compact 1.2K/3.4M formatting for view/like counts"""
+    if not num:
+        return "0"
+    if num >= 1000000:
+        return f"{num/1000000:.1f}M"
+    if num >= 1000:
+        return f"{num/1000:.1f}K"
+    return str(num)
+
+
 class TikTokDownloader(BaseDownloader):
     """TikTok downloader using Cobalt API with yt-dlp fallback"""
-    
+
+    # Shared templates; per-call opts are a shallow copy with format/outtmpl
+    # overridden so no nested dicts get rebuilt on the hot path
+    _PROBE_OPTS = {
+        'format': 'best',
+        'quiet': True,
+        'no_warnings': True,
+    }
+    _DOWNLOAD_OPTS = {
+        'quiet': False,
+        'no_warnings': True,
+    }
+
     def platform_id(self) -> str:
         return 'tiktok'
 
@@ -52,12 +76,8 @@ class TikTokDownloader(BaseDownloader):
         # Fallback to yt-dlp
         logger.info(f"[TikTok] Cobalt failed ({result.error}), trying yt-dlp")
         try:
-            ydl_opts = {
-                'format': 'best',
-                'quiet': True,
-                'no_warnings': True,
-            }
-            
+            ydl_opts = self._PROBE_OPTS.copy()
+
             def extract():
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     return ydl.extract_info(url, download=False)
@@ -83,9 +103,9 @@ class TikTokDownloader(BaseDownloader):
     async def download(self, url: str, format_id: Optional[str] = None) -> Tuple[str, Path]:
         """Download video - Cobalt first, yt-dlp fallback"""
         logger.info(f"[TikTok] Downloading: {url}")
-        download_dir = Path(__file__).parent.parent.parent / "downloads"
-        download_dir.mkdir(exist_ok=True)
-        
+        # Created once at config import; avoids a mkdir syscall per download
+        download_dir = DOWNLOADS_DIR
+
         # === Try Cobalt (no watermark!) ===
         self.update_progress('status_downloading', 10)
         filename, file_path = await cobalt.download(
@@ -105,13 +125,10 @@ class TikTokDownloader(BaseDownloader):
         
         try:
             temp_filename = f"tiktok_{os.urandom(4).hex()}"
-            ydl_opts = {
-                'format': format_id or 'best',
-                'outtmpl': str(download_dir / f"{temp_filename}.%(ext)s"),
-                'quiet': False,
-                'no_warnings': True,
-                'progress_hooks': [self._progress_hook],
-            }
+            ydl_opts = self._DOWNLOAD_OPTS.copy()
+            ydl_opts['format'] = format_id or 'best'
+            ydl_opts['outtmpl'] = str(download_dir / f"{temp_filename}.%(ext)s")
+            ydl_opts['progress_hooks'] = [self._progress_hook]
             
             def download_video():
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -125,15 +142,10 @@ class TikTokDownloader(BaseDownloader):
             # Find downloaded file
             for file in download_dir.glob(f"{temp_filename}.*"):
                 if file.is_file():
-                    def format_number(num):
-                        if not num: return "0"
-                        if num >= 1000000: return f"{num/1000000:.1f}M"
-                        if num >= 1000: return f"{num/1000:.1f}K"
-                        return str(num)
-                    
-                    likes = format_number(info.get('like_count', 0))
-                    username = info.get('uploader', '').replace('https://www.tiktok.com/@', '')
-                    views = format_number(info.get('view_count', 0))
+                    g = info.get
+                    likes = _format_number(g('like_count', 0))
+                    username = (g('uploader') or '').replace('https://www.tiktok.com/@', '')
+                    views = _format_number(g('view_count', 0))
                     
                     metadata = f"TikTok | {views} | {likes}\nby <a href=\"{url}\">{username}</a>"
                     return metadata, file
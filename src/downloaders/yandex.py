@@ -12,6 +12,18 @@ from ..config import DOWNLOADS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import instead of per call
+_URL_RES = [re.compile(p) for p in (
+    r'music\.yandex\.[a-z]+/album/(\d+)/track/(\d+)',
+    r'music\.yandex\.[a-z]+/track/(\d+)',
+)]
+_ALBUM_TRACK_RE = re.compile(r'album/(\d+)/track/(\d+)')
+_TRACK_RE = re.compile(r'track/(\d+)')
+# One alternation scans the page a single time for both og: tags
+_OG_META_RE = re.compile(r'<meta[^>]+property="og:(title|description)"[^>]+content="([^"]+)"')
+_TITLE_TAG_RE = re.compile(r'<title>([^<]+)</title>')
+_TITLE_SUFFIX_RE = re.compile(r'\s*[-—|]\s*(слушать|listen).*$', re.IGNORECASE)
+
 class YandexMusicDownloader(BaseDownloader):
     """Downloader for Yandex Music"""
 
@@ -43,65 +55,82 @@ class YandexMusicDownloader(BaseDownloader):
 
     def can_handle(self, url: str) -> bool:
         """Check if URL is from Yandex Music"""
-        patterns = [
-            r'music\.yandex\.[a-z]+/album/(\d+)/track/(\d+)',
-            r'music\.yandex\.[a-z]+/track/(\d+)',
-        ]
-        return any(re.search(pattern, url) for pattern in patterns)
+        return any(pattern.search(url) for pattern in _URL_RES)
 
     def _extract_track_id(self, url: str) -> str:
         """Extract track ID from URL"""
         # Try album/track pattern first
-        match = re.search(r'album/(\d+)/track/(\d+)', url)
+        match = _ALBUM_TRACK_RE.search(url)
         if match:
             return f"{match.group(2)}:{match.group(1)}"
-        
+
         # Try direct track pattern
-        match = re.search(r'track/(\d+)', url)
+        match = _TRACK_RE.search(url)
         if match:
             return match.group(1)
         
         raise DownloadError("Could not extract track ID from URL")
 
+    @staticmethod
+    def _fetch_page_head(url: str, headers: Dict) -> Tuple[int, Optional[str]]:
+        """Fetch page HTML, stopping early once the meta tags have arrived
+
+        The og: tags live in the first few KB of the page, so streaming and
+        short-circuiting avoids downloading the rest of the document.
+        """
+        with requests.get(url, headers=headers, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, None
+
+            buf = bytearray()
+            for chunk in response.iter_content(16384):
+                buf += chunk
+                if (b'og:description' in buf and b'og:title' in buf) or len(buf) >= 512 * 1024:
+                    break
+            return 200, buf.decode(response.encoding or 'utf-8', errors='replace')
+
     async def _get_track_info_from_page(self, url: str) -> Optional[Dict]:
         """Get track info by fetching Yandex Music page HTML (no auth required)"""
         logger.info(f"[Yandex] Fetching track info from page: {url}")
-        
+
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7',
             }
-            
-            response = await asyncio.to_thread(requests.get, url, headers=headers, timeout=15)
-            
-            if response.status_code != 200:
-                logger.info(f"[Yandex] Page request failed: {response.status_code}")
+
+            status, html = await asyncio.to_thread(self._fetch_page_head, url, headers)
+
+            if html is None:
+                logger.info(f"[Yandex] Page request failed: {status}")
                 return None
-            
-            html = response.text
-            
-            # Extract both title and description
+
+            # Extract both title and description in a single pass
             title = None
             artist = None
-            
-            # Get og:title (track name)
-            og_title = re.search(r'<meta[^>]+property="og:title"[^>]+content="([^"]+)"', html)
-            if og_title:
-                title = og_title.group(1)
+
+            meta = {}
+            for m in _OG_META_RE.finditer(html):
+                if m.group(1) not in meta:
+                    meta[m.group(1)] = m.group(2)
+                if len(meta) == 2:
+                    break
+
+            # og:title (track name)
+            if 'title' in meta:
+                title = meta['title']
                 logger.info(f"[Yandex] Found og:title: {title}")
-            
-            # Get og:description (format: "Artist • Трек • Year" or "Artist • Альбом • Year")
-            og_desc = re.search(r'<meta[^>]+property="og:description"[^>]+content="([^"]+)"', html)
-            if og_desc:
-                desc = og_desc.group(1)
+
+            # og:description (format: "Artist • Трек • Year" or "Artist • Альбом • Year")
+            if 'description' in meta:
+                desc = meta['description']
                 logger.info(f"[Yandex] Found og:description: {desc}")
                 # Extract artist (first part before •)
                 parts = desc.split('•')
                 if parts:
                     artist = parts[0].strip()
-            
+
             # Build search query with artist + title
             if title and artist:
                 query = f"{artist} - {title}"
@@ -112,10 +141,10 @@ class YandexMusicDownloader(BaseDownloader):
                 return {'search_query': title}
             
             # Fallback: title tag
-            title_tag = re.search(r'<title>([^<]+)</title>', html)
+            title_tag = _TITLE_TAG_RE.search(html)
             if title_tag:
                 title = title_tag.group(1)
-                title = re.sub(r'\s*[-—|]\s*(слушать|listen).*$', '', title, flags=re.IGNORECASE)
+                title = _TITLE_SUFFIX_RE.sub('', title)
                 logger.info(f"[Yandex] Found title tag: {title}")
                 return {'search_query': title}
             
@@ -223,6 +252,7 @@ class YandexMusicDownloader(BaseDownloader):
             logger.info(f"[Yandex] Track ID: {track_id}")
 
             # Try Yandex Music API first if client is available
+            track_info = None
             if self.client:
                 try:
                     track_info = await self._get_track_info_from_api(track_id)
@@ -271,8 +301,10 @@ class YandexMusicDownloader(BaseDownloader):
                 search_query = page_info['search_query']
                 logger.info(f"[Yandex] Using search query from page: {search_query}")
             elif self.client:
-                # Try API as fallback for search query
-                track_info = await self._get_track_info_from_api(track_id)
+                # Reuse info fetched in the API branch; only hit the API again
+                # if we never got it
+                if track_info is None:
+                    track_info = await self._get_track_info_from_api(track_id)
                 if track_info:
                     artists = ", ".join(track_info['artists'])
                     search_query = f"{artists} - {track_info['title']}"
@@ -2,6 +2,7 @@ import re
 import os
 import logging
 import asyncio
+import time
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
 import yt_dlp
@@ -11,9 +12,14 @@ from .base import BaseDownloader, DownloadError
 logger = logging.getLogger(__name__)
 
 class YouTubeDownloader(BaseDownloader):
+    # How long info extracted during get_formats stays fresh enough to reuse
+    _INFO_CACHE_TTL = 60
+    _INFO_CACHE_MAX = 16
+
     def __init__(self):
         super().__init__()
         self.cookie_file = Path(__file__).parent.parent.parent / "cookies" / "youtube.txt"
+        self._info_cache: Dict[str, Tuple[float, Dict]] = {}
 
     def platform_id(self) -> str:
         """Return platform identifier"""
@@ -92,6 +98,17 @@ class YouTubeDownloader(BaseDownloader):
                 info = await asyncio.to_thread(
                     ydl.extract_info, str(processed_url), download=False
                 )
+                if info:
+                    now = time.monotonic()
+                    # Evict expired and oldest entries here: probes without a
+                    # follow-up download never pop their entry, so insertion
+                    # is the only place the cache can be kept bounded
+                    for stale in [k for k, (ts, _) in self._info_cache.items()
+                                  if now - ts > self._INFO_CACHE_TTL]:
+                        del self._info_cache[stale]
+                    while len(self._info_cache) >= self._INFO_CACHE_MAX:
+                        del self._info_cache[next(iter(self._info_cache))]
+                    self._info_cache[processed_url] = (now, info)
                 if info and 'formats' in info:
                     formats = []
                     seen = set()
@@ -137,18 +154,30 @@ class YouTubeDownloader(BaseDownloader):
                 'outtmpl': str(download_dir / '%(id)s.%(ext)s'),
             })
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.update_progress('status_downloading', 20)
-                info = await asyncio.to_thread(
-                    ydl.extract_info, str(processed_url), download=True
-                )
-                if info:
-                    # Get downloaded file path and verify it exists
-                    filename = ydl.prepare_filename(info)
-                    file_path = Path(filename).resolve()
-                    if file_path.exists():
-                        logger.info("[YouTube] Download completed successfully")
-                        return self._prepare_metadata(info, processed_url), file_path
+            # Reuse info extracted during get_formats instead of scraping twice
+            cached = self._info_cache.pop(processed_url, None)
+            if cached and time.monotonic() - cached[0] > self._INFO_CACHE_TTL:
+                cached = None
+
+            def download_content():
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    if cached:
+                        try:
+                            result = ydl.process_ie_result(dict(cached[1]), download=True)
+                            return result, ydl.prepare_filename(result)
+                        except Exception as e:
+                            logger.warning(f"[YouTube] Cached info unusable, re-extracting: {e}")
+                    result = ydl.extract_info(str(processed_url), download=True)
+                    return result, ydl.prepare_filename(result) if result else None
+
+            self.update_progress('status_downloading', 20)
+            info, filename = await asyncio.to_thread(download_content)
+            if info:
+                # Get downloaded file path and verify it exists
+                file_path = Path(filename).resolve()
+                if file_path.exists():
+                    logger.info("[YouTube] Download completed successfully")
+                    return self._prepare_metadata(info, processed_url), file_path
 
             raise DownloadError("Не удалось загрузить видео")
 
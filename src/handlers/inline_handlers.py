@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from uuid import uuid4
 
@@ -23,6 +24,9 @@ class InlineHandlers:
             return
 
         results = []
+        # Telegram only needs ids unique within one answer, so one uuid4 per
+        # query plus an index beats a fresh uuid4 per result
+        prefix = uuid4().hex[:8]
 
         try:
             tracks = await self.soundcloud_service.search_tracks(query, limit=4)
@@ -31,9 +35,18 @@ class InlineHandlers:
             logger.error(f"SoundCloud search failed: {e}", exc_info=True)
             tracks = []
 
-        for track in tracks:
+        # Resolve all stream URLs concurrently; serial awaits made the answer
+        # wait for the sum of the worker round-trips instead of the slowest one
+        stream_urls = await asyncio.gather(
+            *(self.soundcloud_service.get_stream_url(t) for t in tracks),
+            return_exceptions=True,
+        )
+
+        for i, (track, stream_url) in enumerate(zip(tracks, stream_urls)):
             try:
-                stream_url = await self.soundcloud_service.get_stream_url(track)
+                if isinstance(stream_url, Exception):
+                    logger.warning(f"Failed to get stream URL: {stream_url}")
+                    continue
                 if not stream_url:
                     continue
 
@@ -42,7 +55,7 @@ class InlineHandlers:
                 artist = user_info.get("username") or user_info.get("full_name") or ""
 
                 display_title = f"{artist} - {title}" if artist else title
-                duration = track.get("duration") or track.get("full_duration") or None
+                duration = track.get("duration") or None
                 duration_secs = int(duration / 1000) if duration else None
 
                 caption_lines = [display_title]
@@ -51,7 +64,7 @@ class InlineHandlers:
 
                 results.append(
                     InlineQueryResultAudio(
-                        id=str(uuid4()),
+                        id=f"{prefix}-{i}",
                         audio_url=stream_url,
                         title=display_title,
                         performer=artist or None,
@@ -68,7 +81,7 @@ class InlineHandlers:
             fallback_text = query if query else "SoundCloud search failed"
             results.append(
                 InlineQueryResultArticle(
-                    id=str(uuid4()),
+                    id=f"{prefix}-fb",
                     title="SoundCloud поиск недоступен",
                     description="Нажми, чтобы отправить запрос боту",
                     input_message_content=InputTextMessageContent(
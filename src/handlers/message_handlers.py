@@ -7,6 +7,9 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; runs against every incoming message
+_URL_RE = re.compile(r'https?://[^\s]+')
+
 class MessageHandlers:
     def __init__(self, keyboard_builder, settings_manager, download_manager, localization, activity_logger=None):
         self.keyboard_builder = keyboard_builder
@@ -27,8 +30,8 @@ class MessageHandlers:
         if not text:
             return None
         # URL extraction with support for various URL formats
-        urls = re.findall(r'https?://[^\s]+', text)
-        return urls[0] if urls else None
+        match = _URL_RE.search(text)
+        return match.group(0) if match else None
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming messages with URLs"""
@@ -1,3 +1,5 @@
+import sys
+from functools import lru_cache
 from typing import Dict, Any
 
 # Language codes should match ISO 639-1
@@ -220,6 +222,32 @@ LOCALES: Dict[str, Dict[str, str]] = {
     }
 }
 
+# Intern all values so identical strings across keys and languages
+# ("Best", shared templates) collapse to one object
+for _table in LOCALES.values():
+    for _key, _value in _table.items():
+        _table[_key] = sys.intern(_value)
+
+
+# Pre-split every single-placeholder {progress} template so progress ticks
+# concatenate three strings instead of re-parsing the format string
+_PROGRESS_TMPL: Dict[tuple, tuple] = {}
+for _lang, _table in LOCALES.items():
+    for _key, _value in _table.items():
+        if _value.count('{') == 1 and '{progress}' in _value:
+            _before, _, _after = _value.partition('{progress}')
+            _PROGRESS_TMPL[(_lang, _key)] = (_before, _after)
+
+
+@lru_cache(maxsize=1024)
+def _get_static(lang: str, key: str) -> str:
+    """Resolve a key without formatting; cached since the tables never change"""
+    text = LOCALES.get(lang, LOCALES['en']).get(key)
+    if text is None:
+        text = LOCALES['en'].get(key)
+    return text if text is not None else f"Missing translation: {key}"
+
+
 class Localization:
     @staticmethod
     def get(lang: str, key: str, **kwargs) -> str:
@@ -227,13 +255,33 @@ class Localization:
         Get localized string by key and format it with provided kwargs
         Falls back to English if key not found in selected language
         """
+        # Most calls (buttons, menu titles) carry no kwargs — serve those
+        # straight from the LRU cache
+        if not kwargs:
+            return _get_static(lang, key)
+        # Key misses are plain dict probes; exceptions are reserved for
+        # genuine .format() argument mismatches
+        text = LOCALES.get(lang, LOCALES['en']).get(key)
+        if text is None:
+            text = LOCALES['en'].get(key)
+        if text is None:
+            return f"Missing translation: {key}"
         try:
-            text = LOCALES.get(lang, LOCALES['en'])[key]
-            return text.format(**kwargs) if kwargs else text
-        except (KeyError, ValueError) as e:
-            # Fallback to English if key not found or formatting fails
-            try:
-                text = LOCALES['en'][key]
-                return text.format(**kwargs) if kwargs else text
-            except (KeyError, ValueError):
-                return f"Missing translation: {key}"
+            return text.format(**kwargs)
+        except (KeyError, IndexError, ValueError):
+            # Fall back to the English template if formatting fails
+            en_text = LOCALES['en'].get(key)
+            if en_text is not None and en_text is not text:
+                try:
+                    return en_text.format(**kwargs)
+                except (KeyError, IndexError, ValueError):
+                    pass
+            return f"Missing translation: {key}"
+
+    @staticmethod
+    def progress(lang: str, key: str, progress: int) -> str:
+        """Fast path for status templates fired on every progress tick"""
+        tmpl = _PROGRESS_TMPL.get((lang, key)) or _PROGRESS_TMPL.get(('en', key))
+        if tmpl is None:
+            return Localization.get(lang, key, progress=progress)
+        return f"{tmpl[0]}{progress}{tmpl[1]}"
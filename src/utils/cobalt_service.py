@@ -12,19 +12,43 @@ Configuration:
 import os
 import json
 import asyncio
+import hashlib
 import logging
-import subprocess
 import random
 import time
 from pathlib import Path
 from typing import Optional, Dict, Tuple, List
+from urllib.parse import urlsplit
 from dataclasses import dataclass
+from collections import defaultdict
+from functools import lru_cache
+
+import aiohttp
+
+from .http import get_session, close_session
+
+# orjson parses the (often large) API responses several times faster than
+# stdlib json; fall back silently when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 logger = logging.getLogger(__name__)
 
 # Instances API
 INSTANCES_API = "https://instances.cobalt.best/api/instances.json"
 INSTANCES_CACHE_TTL = 3600  # 1 hour
+# Instance list persisted across restarts so a fresh process never blocks
+# its first download on the instances fetch
+INSTANCES_CACHE_FILE = Path(__file__).resolve().parents[2] / ".cache" / "instances.json"
 
 # Official API (requires token)
 OFFICIAL_API = "https://api.cobalt.tools/"
@@ -68,6 +92,26 @@ COBALT_SERVICES = {
     "bluesky": ["bsky.app"],
 }
 
+# Inverted at import so URL classification is a hash lookup per host label
+# instead of a substring scan over every service's domain list
+_DOMAIN_TO_SERVICE = {d: s for s, ds in COBALT_SERVICES.items() for d in ds}
+
+
+@lru_cache(maxsize=4096)
+def _classify_host(host: str) -> Optional[str]:
+    """Map a lowercased host to its service name
+
+    Walks dot-separated suffixes so subdomains (www., vm., music.) match
+    their registered parent domain. Pure on a small input space (hosts
+    users actually send), so the memoized answer is reused every time the
+    same URL is classified again during a message's lifecycle.
+    """
+    while host:
+        service = _DOMAIN_TO_SERVICE.get(host)
+        if service: return service
+        host = host.partition('.')[2]
+    return None
+
 
 @dataclass
 class CobaltResult:
@@ -86,8 +130,41 @@ class CobaltService:
         self._instances: List[str] = []
         self._instances_updated: float = 0
         self._current_index: int = 0
-        self._failed_instances: set = set()
+        # Per-instance circuit breakers: repeated failures open the breaker
+        # for a growing cooldown instead of benching the instance until the
+        # next full refresh
+        self._breakers: Dict[str, Dict[str, float]] = defaultdict(lambda: {'fails': 0, 'open_until': 0.0})
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Single-flight map: concurrent identical requests share one probe
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bulkhead: cap concurrent upstream negotiations so a burst of users
+        # cannot trip rate limits on every instance at once (lazy so the
+        # semaphore binds to the running loop)
+        self._bulkhead: Optional[asyncio.Semaphore] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Process-wide keep-alive session shared with the other services"""
+        self._session = await get_session()
+        return self._session
+
+    async def close(self):
+        """Release the shared session on shutdown"""
+        self._session = None
+        await close_session()
     
+    def _is_open(self, instance: str) -> bool:
+        breaker = self._breakers.get(instance)
+        return breaker is not None and time.monotonic() < breaker['open_until']
+
+    def _mark_failure(self, instance: str):
+        breaker = self._breakers[instance]
+        breaker['fails'] += 1
+        breaker['open_until'] = time.monotonic() + min(breaker['fails'], 5) * 60
+
+    def _mark_success(self, instance: str):
+        self._breakers.pop(instance, None)
+
     def _get_random_user_agent(self) -> str:
         agents = [
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -99,14 +176,13 @@ class CobaltService:
     async def _fetch_instances(self) -> List[str]:
         """Fetch public instances from API"""
         try:
-            cmd = [
-                'curl', '-s', INSTANCES_API,
-                '-H', f'User-Agent: {self._get_random_user_agent()}',
-                '--max-time', '10'
-            ]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=15)
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
+            session = await self._get_session()
+            headers = {'User-Agent': self._get_random_user_agent()}
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with session.get(INSTANCES_API, headers=headers, timeout=timeout) as resp:
+                body = await resp.read()
+            if body:
+                data = _json_loads(body)
                 instances = []
                 for item in data:
                     api = item.get('api') or item.get('api_url')
@@ -119,52 +195,120 @@ class CobaltService:
             pass
         return FALLBACK_INSTANCES.copy()
     
+    @staticmethod
+    def _load_cached_instances() -> Optional[List[str]]:
+        try:
+            data = _json_loads(INSTANCES_CACHE_FILE.read_bytes())
+            if isinstance(data, list) and data:
+                return data
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _store_cached_instances(instances: List[str]):
+        try:
+            INSTANCES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            INSTANCES_CACHE_FILE.write_text(_json_dumps(instances))
+        except OSError:
+            pass
+
+    async def _refresh_instances(self):
+        fetched = await self._fetch_instances()
+        self._instances = list(set(fetched + FALLBACK_INSTANCES))
+        self._instances_updated = time.time()
+        self._breakers.clear()
+        random.shuffle(self._instances)
+        self._store_cached_instances(self._instances)
+
     async def _get_instances(self) -> List[str]:
-        now = time.time()
-        if not self._instances or (now - self._instances_updated) > INSTANCES_CACHE_TTL:
-            fetched = await self._fetch_instances()
-            self._instances = list(set(fetched + FALLBACK_INSTANCES))
-            self._instances_updated = now
-            self._failed_instances.clear()
-            random.shuffle(self._instances)
-        
-        available = [i for i in self._instances if i not in self._failed_instances]
+        if not self._instances:
+            # Cold process: reuse the list persisted by the previous run
+            cached = self._load_cached_instances()
+            if cached:
+                self._instances = cached
+                try:
+                    self._instances_updated = INSTANCES_CACHE_FILE.stat().st_mtime
+                except OSError:
+                    self._instances_updated = 0
+                random.shuffle(self._instances)
+
+        if not self._instances:
+            # No disk cache either: the only time we block on the network
+            await self._refresh_instances()
+        elif (time.time() - self._instances_updated) > INSTANCES_CACHE_TTL:
+            # Stale-while-revalidate: serve the current list, renew off-path
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_instances())
+
+        # Skip instances whose breaker is open; they get probed again
+        # automatically once the cooldown elapses (half-open)
+        available = [i for i in self._instances if not self._is_open(i)]
         if not available:
-            self._failed_instances.clear()
             available = self._instances.copy()
             random.shuffle(available)
         return available
 
     async def _make_request(self, api_url: str, payload: dict, use_token: bool = False) -> Optional[dict]:
-        payload_json = json.dumps(payload)
-        headers = [
-            '-H', 'accept: application/json',
-            '-H', 'content-type: application/json',
-            '-H', f'User-Agent: {self._get_random_user_agent()}',
-            '-H', f'Origin: {api_url.rstrip("/")}',
-            '-H', f'Referer: {api_url}',
-        ]
-        
+        headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'User-Agent': self._get_random_user_agent(),
+            'Origin': api_url.rstrip('/'),
+            'Referer': api_url,
+        }
+
         if use_token and OFFICIAL_TOKEN:
-            headers.extend([
-                '-H', f'authorization: Bearer {OFFICIAL_TOKEN}',
-                '-H', 'origin: https://cobalt.tools',
-                '-H', 'referer: https://cobalt.tools/',
-            ])
-        
-        cmd = ['curl', '-s', api_url] + headers + ['--data-raw', payload_json, '--max-time', '25']
-        
+            headers.update({
+                'Authorization': f'Bearer {OFFICIAL_TOKEN}',
+                'Origin': 'https://cobalt.tools',
+                'Referer': 'https://cobalt.tools/',
+            })
+
         try:
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0 and result.stdout:
-                if result.stdout.strip().startswith('<'): return None # HTML/Cloudflare
-                try: return json.loads(result.stdout)
+            session = await self._get_session()
+            timeout = aiohttp.ClientTimeout(connect=5, total=25)
+            async with session.post(api_url, data=_json_dumps(payload), headers=headers, timeout=timeout) as resp:
+                body = await resp.read()
+            if body:
+                # O(1) sniff of the leading bytes instead of stripping the
+                # whole body just to inspect its first character
+                if body[:64].lstrip().startswith(b'<'): return None # HTML/Cloudflare
+                try: return _json_loads(body)
                 except: pass
         except: pass
         return None
 
     async def request(self, url: str, **kwargs) -> CobaltResult:
-        """Make request to Cobalt API"""
+        """Make request to Cobalt API
+
+        Concurrent identical requests (e.g. the same reel shared in a busy
+        group) are collapsed into a single upstream negotiation.
+        """
+        key = f"{url}|{sorted(kwargs.items())}"
+        task = self._inflight.get(key)
+        if task is None:
+            if self._bulkhead is None:
+                self._bulkhead = asyncio.Semaphore(6)
+            # The shared probe runs in its own task so that cancelling any
+            # one caller (including the first) never tears down the probe
+            # the other coalesced callers are waiting on
+            task = asyncio.create_task(self._bounded_request(url, **kwargs))
+            self._inflight[key] = task
+
+            def _cleanup(t: asyncio.Task, key=key):
+                self._inflight.pop(key, None)
+                if not t.cancelled():
+                    t.exception()  # mark retrieved in case every waiter was cancelled
+
+            task.add_done_callback(_cleanup)
+        return await asyncio.shield(task)
+
+    async def _bounded_request(self, url: str, **kwargs) -> CobaltResult:
+        async with self._bulkhead:
+            return await self._request(url, **kwargs)
+
+    async def _request(self, url: str, **kwargs) -> CobaltResult:
         payload = {
             "url": url,
             "videoQuality": kwargs.get("video_quality", "1080"),
@@ -174,45 +318,82 @@ class CobaltService:
             "twitterGif": True,
         }
         
+        # Warm the public-instance list while the official API answers so a
+        # fallback never starts with a cold instances fetch
+        instances_task = asyncio.create_task(self._get_instances())
+
         # 1. Try Official API if token exists (Most Reliable)
         if OFFICIAL_TOKEN:
-            logger.info("[Cobalt] Using official API with token")
+            logger.debug("[Cobalt] Using official API with token")
             data = await self._make_request(OFFICIAL_API, payload, use_token=True)
+            result = None
             if data:
                 if data.get("status") in ("redirect", "tunnel"):
-                    return CobaltResult(success=True, url=data.get("url"), filename=data.get("filename"))
+                    result = CobaltResult(success=True, url=data.get("url"), filename=data.get("filename"))
                 elif data.get("status") == "picker":
-                    return CobaltResult(success=True, picker=data.get("picker", []))
+                    result = CobaltResult(success=True, picker=data.get("picker", []))
                 elif data.get("status") == "error":
-                    return CobaltResult(success=False, error=data.get("error", {}).get("code"))
+                    result = CobaltResult(success=False, error=data.get("error", {}).get("code"))
+            if result is not None:
+                instances_task.cancel()
+                return result
 
         # 2. Try Public Instances (Fallback)
-        instances = await self._get_instances()
+        instances = await instances_task
         max_attempts = 5
-        
-        for attempt in range(min(max_attempts, len(instances))):
-            instance = instances[attempt]
-            logger.info(f"[Cobalt] Trying instance {attempt+1}: {instance}")
-            
-            data = await self._make_request(instance, payload)
-            
-            if data:
-                status = data.get("status")
-                if status in ("redirect", "tunnel"):
-                    return CobaltResult(success=True, url=data.get("url"), filename=data.get("filename"))
-                elif status == "picker":
-                    return CobaltResult(success=True, picker=data.get("picker", []))
-                elif status == "error":
-                    code = data.get("error", {}).get("code")
-                    if any(x in str(code) for x in ["content", "unavailable", "private"]):
-                        return CobaltResult(success=False, error=code)
-            
-            self._failed_instances.add(instance)
-        
+        candidates = instances[:max_attempts]
+
+        # Probe up to 3 instances at once and take the first usable answer;
+        # serially, every slow/dead instance added its full timeout to the
+        # user's wait
+        fanout = 3
+        tasks = {
+            asyncio.create_task(self._make_request(inst, payload)): inst
+            for inst in candidates[:fanout]
+        }
+        next_idx = len(tasks)
+        result = None
+        while tasks and result is None:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                instance = tasks.pop(task)
+                logger.debug("[Cobalt] Instance answered: %s", instance)
+                parsed = self._parse_instance_response(task.result(), instance)
+                if parsed is not None:
+                    result = parsed
+                    break
+                self._mark_failure(instance)
+                # Keep the fan-out width topped up from the remaining candidates
+                if next_idx < len(candidates):
+                    inst = candidates[next_idx]
+                    next_idx += 1
+                    tasks[asyncio.create_task(self._make_request(inst, payload))] = inst
+        for task in tasks:
+            task.cancel()
+
+        if result is not None:
+            return result
         return CobaltResult(success=False, error="All instances failed")
 
+    def _parse_instance_response(self, data: Optional[dict], instance: str) -> Optional[CobaltResult]:
+        """Turn an instance's response into a CobaltResult, or None if unusable"""
+        if data:
+            status = data.get("status")
+            if status in ("redirect", "tunnel"):
+                self._mark_success(instance)
+                return CobaltResult(success=True, url=data.get("url"), filename=data.get("filename"))
+            elif status == "picker":
+                self._mark_success(instance)
+                return CobaltResult(success=True, picker=data.get("picker", []))
+            elif status == "error":
+                code = data.get("error", {}).get("code")
+                if any(x in str(code) for x in ["content", "unavailable", "private"]):
+                    # Content-level error: the instance itself is healthy
+                    self._mark_success(instance)
+                    return CobaltResult(success=False, error=code)
+        return None
+
     async def download(self, url: str, download_dir: Path, progress_callback=None, **kwargs) -> Tuple[Optional[str], Optional[Path]]:
-        import requests
         service = self.get_service_name(url) or "video"
         
         if progress_callback: progress_callback('status_downloading', 10)
@@ -230,30 +411,67 @@ class CobaltService:
         
         if progress_callback: progress_callback('status_downloading', 30)
         
+        part_path = None
         try:
-            response = await asyncio.to_thread(requests.get, result.url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=180)
-            if response.status_code != 200: return None, None
-            
-            filename = result.filename or f"{service}_{hash(url) % 100000}.mp4"
+            # Stable digest: the same URL maps to the same filename across
+            # restarts (hash() is salted per process)
+            filename = result.filename or f"{service}_{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}.mp4"
             download_dir.mkdir(exist_ok=True)
             file_path = download_dir / filename
-            
-            with open(file_path, 'wb') as f: f.write(response.content)
-            
+            # Stream into a uniquely named .part file: a crashed download
+            # never leaves a truncated mp4 behind, memory stays at one
+            # chunk, and concurrent duplicates of the same URL cannot
+            # truncate each other mid-stream — each finisher atomically
+            # replaces the stable name, last writer wins
+            part_path = file_path.with_name(f"{file_path.name}.{os.urandom(4).hex()}.part")
+
+            session = await self._get_session()
+            # Connect failures are cheap to detect (5s) while a healthy
+            # transfer may legitimately take minutes; retry only transient
+            # network errors, with jittered backoff
+            timeout = aiohttp.ClientTimeout(connect=5, sock_read=30, total=180)
+            for attempt in range(3):
+                try:
+                    async with session.get(result.url, timeout=timeout) as response:
+                        if response.status != 200:
+                            part_path.unlink(missing_ok=True)
+                            return None, None
+                        total = response.content_length or 0
+                        downloaded = 0
+                        with open(part_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                if progress_callback and total:
+                                    progress_callback('status_downloading', min(99, 30 + int(downloaded / total * 69)))
+                    break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == 2:
+                        raise
+                    delay = 0.5 * (2 ** attempt) + random.uniform(0, 0.5)
+                    logger.warning(f"[Cobalt] Transient download error ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+
+            os.replace(part_path, file_path)
+
             if progress_callback: progress_callback('status_downloading', 100)
             return filename, file_path
         except Exception as e:
             logger.error(f"[Cobalt] Download error: {e}")
+            if part_path is not None:
+                part_path.unlink(missing_ok=True)
             return None, None
 
     @staticmethod
     def can_handle(url: str) -> bool:
-        return any(d in url.lower() for domains in COBALT_SERVICES.values() for d in domains)
+        return CobaltService.get_service_name(url) is not None
     
     @staticmethod
     def get_service_name(url: str) -> Optional[str]:
-        for service, domains in COBALT_SERVICES.items():
-            if any(d in url.lower() for d in domains): return service
-        return None
+        try:
+            host = urlsplit(url).hostname or ''
+        except ValueError:
+            return None
+        return _classify_host(host.lower())
 
 cobalt = CobaltService()
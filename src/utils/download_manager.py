@@ -44,17 +44,21 @@ class DownloadWorker:
     async def update_status(self, message: Message, user_id: int, status_key: str, progress: int):
         """Update status message with current progress"""
         try:
-            # Rate limit status updates
-            current_time = time.time()
+            # Rate limit status updates (monotonic: immune to wall-clock jumps)
+            current_time = time.monotonic()
             if current_time - self._last_update_time < self._update_interval:
                 return
 
-            new_text = self.get_message(user_id, status_key, progress=progress)
+            settings = self.settings_manager.get_settings(user_id)
+            new_text = self.localization.progress(settings.language, status_key, progress)
             if new_text == self._last_status and progress == self._last_progress:
                 return
 
             try:
-                await asyncio.wait_for(message.edit_text(new_text), timeout=2.0)
+                # asyncio.timeout reuses the current task's cancel scope
+                # instead of wrapping the edit in a fresh Task per tick
+                async with asyncio.timeout(2.0):
+                    await message.edit_text(new_text)
                 self._last_status = new_text
                 self._last_progress = progress
                 self._last_update_time = current_time
@@ -71,13 +75,28 @@ class DownloadWorker:
         try:
             while not self._stop_event.is_set():
                 try:
-                    status, progress = await asyncio.wait_for(
-                        self._status_queue.get(),
-                        timeout=0.1
-                    )
+                    async with asyncio.timeout(0.1):
+                        status, progress = await self._status_queue.get()
                     if status == "STOP":
                         break
 
+                    # Last-wins coalescing: the downloader can outpace Telegram
+                    # edits, so drop stale values and render only the newest
+                    # queued update
+                    stop = False
+                    while True:
+                        try:
+                            newer = self._status_queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        self._status_queue.task_done()
+                        if newer[0] == "STOP":
+                            stop = True
+                            break
+                        status, progress = newer
+                    if stop:
+                        break
+
                     if self._current_message and self._current_user_id:
                         await self.update_status(
                             self._current_message,
@@ -390,7 +409,8 @@ class DownloadManager:
 
                 # Get and process download task
                 try:
-                    _, worker, args = await asyncio.wait_for(self.download_queue.get(), timeout=0.5)
+                    async with asyncio.timeout(0.5):
+                        _, worker, args = await self.download_queue.get()
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
@@ -0,0 +1,46 @@
+"""Process-wide aiohttp session shared by all outbound HTTP clients
+
+One connector amortizes DNS lookups and TLS handshakes across Cobalt
+instances, the SoundCloud worker, and CDN downloads.
+"""
+
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # Bursts of parallel stream lookups all land on the same API/CDN
+            # hosts; cap per-host connections, keep them warm past the
+            # default 15s, and reap closed TLS transports promptly
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'User-Agent': 'Mozilla/5.0'}
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared session on shutdown (safe to call twice)"""
+    global _session
+    if _session and not _session.closed:
+        try:
+            await _session.close()
+        except Exception as e:
+            logger.warning(f"Error closing shared HTTP session: {e}")
+    _session = None
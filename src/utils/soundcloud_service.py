@@ -1,11 +1,22 @@
 import asyncio
+import json
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
 
+from .http import get_session, close_session
+
+# Prefer orjson for decoding worker responses when available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Cloudflare Worker URL for SoundCloud API proxy
@@ -19,23 +30,34 @@ SOUNDCLOUD_WORKER_URL = os.getenv(
 class SoundcloudService:
     """SoundCloud service using Cloudflare Worker proxy for API access."""
 
-    _instance = None
+    # Inline search repeats the same queries constantly (every keystroke);
+    # a short TTL keeps results fresh while absorbing the repeats
+    _SEARCH_CACHE_TTL = 300
+    _SEARCH_CACHE_MAX = 256
+
+    # Resolved CDN URLs stay valid for a while; remember them so repeat
+    # plays of the same track skip the /stream round-trip
+    _STREAM_CACHE_TTL = 1800
+    _STREAM_CACHE_MAX = 256
+
+    # Track metadata is effectively immutable; the same link shared
+    # repeatedly should only resolve once per TTL window
+    _RESOLVE_CACHE_TTL = 300
+    _RESOLVE_CACHE_MAX = 256
 
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
+        self._search_cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._stream_cache: "OrderedDict[Any, Tuple[float, str]]" = OrderedDict()
+        self._resolve_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
     @classmethod
     def get_instance(cls) -> "SoundcloudService":
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _INSTANCE
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=20)
-            )
+        """Get the process-wide shared aiohttp session."""
+        self._session = await get_session()
         return self._session
 
     @property
@@ -49,9 +71,10 @@ class SoundcloudService:
         url = f"{SOUNDCLOUD_WORKER_URL}{endpoint}?{urlencode(params)}"
         
         try:
-            async with session.get(url) as resp:
+            # Worker calls keep their own, tighter deadline on the shared session
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await resp.json(loads=_json_loads)
                 else:
                     text = await resp.text()
                     logger.error(f"Worker error {resp.status}: {text[:200]}")
@@ -65,34 +88,25 @@ class SoundcloudService:
 
     def _normalize_track(self, track: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize track data to standard format."""
-        user = track.get("user") or {}
-        media = track.get("media") or {}
-        
-        # Find progressive stream URL from transcodings
-        stream_url = None
-        transcodings = media.get("transcodings") or []
-        for t in transcodings:
-            fmt = t.get("format") or {}
-            if fmt.get("protocol") == "progressive":
-                # This is the transcoding URL, not the final stream URL
-                # We'll need to call /stream to get the actual URL
-                break
+        g = track.get
+        user = g("user") or {}
         
+        # The transcodings only carry API URLs, not playable streams; the
+        # worker's /stream endpoint resolves the real URL on demand, so
+        # neither the media blob nor a duplicate duration is worth keeping
         return {
-            "id": track.get("id"),
-            "title": track.get("title") or "SoundCloud Track",
+            "id": g("id"),
+            "title": g("title") or "SoundCloud Track",
             "kind": "track",
-            "permalink_url": track.get("permalink_url"),
-            "duration": track.get("duration", 0),  # already in ms
-            "full_duration": track.get("duration", 0),
-            "artwork_url": track.get("artwork_url"),
-            "playback_count": track.get("playback_count"),
+            "permalink_url": g("permalink_url"),
+            "duration": g("duration", 0),  # already in ms
+            "artwork_url": g("artwork_url"),
+            "playback_count": g("playback_count"),
             "user": {
                 "username": user.get("username"),
                 "full_name": user.get("full_name"),
             },
-            "media": media,
-            "_stream_url": stream_url,
+            "_stream_url": None,
         }
 
     async def search_tracks(self, query: str, limit: int = 4) -> List[Dict[str, Any]]:
@@ -100,26 +114,48 @@ class SoundcloudService:
         if not query:
             return []
 
+        key = (query.strip().lower(), limit)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(key)
+            return cached[1]
+
         data = await self._worker_request("/search", {"q": query, "limit": str(limit)})
-        
+
         if not data or "tracks" not in data:
             return []
-        
-        tracks = []
-        for track in data["tracks"]:
-            tracks.append(self._normalize_track(track))
-        
-        logger.info(f"SoundCloud search '{query}' -> {len(tracks)} tracks")
+
+        normalize = self._normalize_track
+        tracks = [normalize(track) for track in data["tracks"]]
+
+        if tracks:
+            self._search_cache[key] = (time.monotonic(), tracks)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self._SEARCH_CACHE_MAX:
+                self._search_cache.popitem(last=False)
+
+        logger.debug("SoundCloud search '%s' -> %d tracks", query, len(tracks))
         return tracks
 
     async def resolve_track(self, url: str) -> Optional[Dict[str, Any]]:
         """Resolve a SoundCloud URL into track metadata."""
+        key = url.strip().rstrip('/')
+        cached = self._resolve_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._RESOLVE_CACHE_TTL:
+            self._resolve_cache.move_to_end(key)
+            return cached[1]
+
         data = await self._worker_request("/resolve", {"url": url})
         
         if not data or "track" not in data:
             return None
-        
-        return self._normalize_track(data["track"])
+
+        track = self._normalize_track(data["track"])
+        self._resolve_cache[key] = (time.monotonic(), track)
+        self._resolve_cache.move_to_end(key)
+        while len(self._resolve_cache) > self._RESOLVE_CACHE_MAX:
+            self._resolve_cache.popitem(last=False)
+        return track
 
     async def get_stream_url(self, track: Dict[str, Any]) -> Optional[str]:
         """
@@ -129,7 +165,13 @@ class SoundcloudService:
         # Check if we already have a cached stream URL
         if track.get("_stream_url"):
             return track["_stream_url"]
-        
+
+        track_id = track.get("id")
+        cached = self._stream_cache.get(track_id) if track_id is not None else None
+        if cached and time.monotonic() - cached[0] < self._STREAM_CACHE_TTL:
+            self._stream_cache.move_to_end(track_id)
+            return cached[1]
+
         # Get track URL
         track_url = track.get("permalink_url")
         if not track_url:
@@ -140,15 +182,25 @@ class SoundcloudService:
         
         if not data or "url" not in data:
             return None
-        
-        return data["url"]
+
+        url = data["url"]
+        if track_id is not None:
+            self._stream_cache[track_id] = (time.monotonic(), url)
+            self._stream_cache.move_to_end(track_id)
+            while len(self._stream_cache) > self._STREAM_CACHE_MAX:
+                self._stream_cache.popitem(last=False)
+        return url
 
     async def close(self):
-        """Close underlying sessions."""
+        """Release the shared session."""
         try:
-            if self._session and not self._session.closed:
-                await asyncio.wait_for(self._session.close(), timeout=3)
+            await asyncio.wait_for(close_session(), timeout=3)
         except Exception as e:
             logger.warning(f"Error closing SoundCloud session: {e}")
         finally:
             self._session = None
+
+
+# Constructed at import, matching the cobalt module; get_instance is then
+# a plain load with no check-and-set race between coroutines
+_INSTANCE = SoundcloudService()